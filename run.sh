@@ -6,10 +6,10 @@
 E_BADARGS=65
 if [ $# -lt 1 ]
 then
-	echo "Usage: `basename $0` [--solver <name>] <input>"
+	echo "Usage: `basename $0` [--solver <name> | --portfolio <N>] <input>"
 	exit $E_BADARGS
 fi
 
 # run the solver — forward all arguments to main.jl
 set -e
-julia --project=. src/main.jl "$@"
+julia --threads=auto --project=. src/main.jl "$@"
@@ -14,6 +14,6 @@ export PATH="$HOME/.juliaup/bin:$PATH"
 # Ensure project deps (e.g. JSON) are installed on this node
 julia --project=. -e 'using Pkg; Pkg.resolve(); Pkg.instantiate()'
 
-#     "dpll", "dpll_bad"  "cdcl_basic" "cdcl_vsids" "cdcl_vsids_luby" 
+#     "dpll", "cdcl_basic" "cdcl_vsids" "cdcl_vsids_luby" 
 SOLVER="cdcl_vsids"
 ./runAll.sh input 300 "${SOLVER}-results.log" "$SOLVER"
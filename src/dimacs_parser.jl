@@ -7,68 +7,59 @@ using ..Main: SATInstance, add_variable!, add_clause!
 export parse_cnf_file
 
 function parse_cnf_file(filename::String)::Union{SATInstance, Nothing}
-    sat_instance = nothing
-    
     try
-        lines = readlines(filename)
-        
-        iterator = Iterators.Stateful(lines)
-        line = nothing
-        tokens = nothing
-        
-        # Skip comments
-        while true
-            if isempty(iterator)
-                break
-            end
-            
-            line = strip(popfirst!(iterator))
-            if isempty(line)
-                continue
-            end
-            
-            tokens = split(line)
-            if tokens[1] != "c"
-                break
-            end
+        return open(parse_cnf, filename)
+    catch e
+        if isa(e, SystemError) && e.errnum == 2  # File not found
+            error("Error: DIMACS file is not found $filename")
+        else
+            rethrow(e)
         end
-        
-        # Parse problem line
-        if isnothing(tokens) || isempty(tokens) || tokens[1] != "p"
-            error("Error: DIMACS file does not have problem line")
+    end
+end
+
+# Stream the file line by line; each clause is built directly from the
+# tokens of its line without buffering the rest of the file.
+function parse_cnf(io::IO)::Union{SATInstance, Nothing}
+    tokens = nothing
+    
+    # Skip comments
+    for raw_line in eachline(io)
+        line = strip(raw_line)
+        if isempty(line)
+            continue
         end
         
-        if tokens[2] != "cnf"
-            println("Error: DIMACS file format is not cnf")
-            return nothing
+        tokens = split(line)
+        if tokens[1] != "c"
+            break
         end
-        
-        num_vars = parse(Int, tokens[3])
-        num_clauses = parse(Int, tokens[4])
-        sat_instance = SATInstance(num_vars, num_clauses)
-        
-        # Parse clauses from the rest of the file
-        clause_lines = collect(iterator)
-        
-        function token_generator()
-            Channel() do channel
-                for l in clause_lines
-                    l = strip(l)
-                    if isempty(l)
-                        continue
-                    end
-                    if startswith(l, "c")
-                        continue
-                    end
-                    for t in split(l)
-                        put!(channel, t)
-                    end
-                end
-            end
+    end
+    
+    # Parse problem line
+    if isnothing(tokens) || isempty(tokens) || tokens[1] != "p"
+        error("Error: DIMACS file does not have problem line")
+    end
+    
+    if tokens[2] != "cnf"
+        println("Error: DIMACS file format is not cnf")
+        return nothing
+    end
+    
+    num_vars = parse(Int, tokens[3])
+    num_clauses = parse(Int, tokens[4])
+    sat_instance = SATInstance(num_vars, num_clauses)
+    sizehint!(sat_instance.clauses, num_clauses)
+    
+    # Parse clauses from the rest of the file
+    current_clause = Set{Int}()
+    for raw_line in eachline(io)
+        line = strip(raw_line)
+        if isempty(line) || startswith(line, "c")
+            continue
         end
         
-        current_clause = Set{Int}()
-        for token in token_generator()
+        for token in split(line)
             if token == "0"
                 # End of clause
                 if !isempty(current_clause)
@@ -77,23 +68,16 @@ function parse_cnf_file(filename::String)::Union{SATInstance, Nothing}
                 current_clause = Set{Int}()
             elseif token == "%"
                 # End of file marker
-                break
+                return sat_instance
             else
                 literal = parse(Int, token)
                 push!(current_clause, literal)
                 add_variable!(sat_instance, literal)
             end
         end
-        
-        return sat_instance
-        
-    catch e
-        if isa(e, SystemError) && e.errnum == 2  # File not found
-            error("Error: DIMACS file is not found $filename")
-        else
-            rethrow(e)
-        end
     end
+    
+    return sat_instance
 end
 
 end  # module
\ No newline at end of file
@@ -3,11 +3,9 @@ include("dimacs_parser.jl")
 include("model_timer.jl")
 
 include("solvers/dpll.jl")
-include("solvers/dpll_bad.jl")
 include("solvers/cdcl_basic_solver.jl")
 include("solvers/cdcl_vsids_solver.jl")
 include("solvers/cdcl_vsids_luby_solver.jl")
-include("solvers/cdcl_vsids_luby_sd.jl")
 include("solvers/cdcl_vsids_luby_nd.jl")
 
 using Pkg
@@ -18,20 +16,64 @@ using JSON
 using .DimacsParser
 
 const SOLVERS = Dict(
-    "dpll"            => inst -> DPLLSolver.run_dpll(inst),
-    "dpll_bad"        => inst -> DPLLBad.run_dpll(inst),
-    "cdcl_basic"      => inst -> CDCLBasic.cdcl_solve(inst),
-    "cdcl_vsids"      => inst -> CDCLVSIDS.cdcl_solve(inst),
-    "cdcl_vsids_luby" => inst -> CDCLVSIDSLuby.cdcl_solve(inst),
-    "cdcl_vsids_luby_sd" => inst -> CDCLVSIDSLubySd.cdcl_solve(inst),
-    "cdcl_vsids_luby_nd" => inst -> CDCLVSIDSLubyNd.cdcl_solve(inst),
+    "dpll"            => (inst; kw...) -> DPLLSolver.run_dpll(inst; kw...),
+    "cdcl_basic"      => (inst; kw...) -> CDCLBasic.cdcl_solve(inst; kw...),
+    "cdcl_vsids"      => (inst; kw...) -> CDCLVSIDS.cdcl_solve(inst; kw...),
+    "cdcl_vsids_luby" => (inst; kw...) -> CDCLVSIDSLuby.cdcl_solve(inst; kw...),
+    "cdcl_vsids_luby_nd" => (inst; kw...) -> CDCLVSIDSLubyNd.cdcl_solve(inst; kw...),
 )
 
 const DEFAULT_SOLVER = "dpll"
 
+# Solvers raced by --portfolio N, most robust first; the first N are used
+const PORTFOLIO = ["cdcl_vsids", "dpll", "cdcl_vsids_luby", "cdcl_basic", "cdcl_vsids_luby_nd"]
+
+# Run the first `n` portfolio solvers on separate threads and return the
+# answer of whichever finishes first. Start julia with --threads to get
+# real parallelism. The losers poll a shared stop flag and are waited on,
+# so no solver is still running once this returns.
+function run_portfolio(instance, n::Int)
+    names = PORTFOLIO[1:n]
+    stop = Threads.Atomic{Bool}(false)
+    results = Channel{Tuple{String, Bool, Any}}(length(names))
+
+    tasks = map(names) do name
+        Threads.@spawn begin
+            try
+                put!(results, (name, true, SOLVERS[name](instance; stop=stop)))
+            catch e
+                put!(results, (name, false, e))
+            end
+        end
+    end
+
+    # A solver that errors drops out of the race instead of ending it
+    winner = nothing
+    first_error = nothing
+    for _ in names
+        name, ok, value = take!(results)
+        if ok
+            winner = (value,)
+            break
+        end
+        println("Portfolio solver $name failed: $value")
+        first_error = something(first_error, value)
+    end
+
+    stop[] = true
+    foreach(wait, tasks)
+
+    if isnothing(winner)
+        throw(first_error)
+    end
+    return winner[1]
+end
+
 function parse_args(args::Vector{String})
     solver_name = DEFAULT_SOLVER
     input_file = nothing
+    portfolio = 0
+    solver_given = false
 
     i = 1
     while i <= length(args)
@@ -40,6 +82,17 @@ function parse_args(args::Vector{String})
                 error("--solver requires a value. Available: $(join(sort(collect(keys(SOLVERS))), ", "))")
             end
             solver_name = args[i + 1]
+            solver_given = true
+            i += 2
+        elseif args[i] == "--portfolio"
+            if i + 1 > length(args)
+                error("--portfolio requires the number of solvers to race (1-$(length(PORTFOLIO)))")
+            end
+            n = tryparse(Int, args[i + 1])
+            if isnothing(n) || !(1 <= n <= length(PORTFOLIO))
+                error("--portfolio requires the number of solvers to race (1-$(length(PORTFOLIO))), got $(args[i + 1])")
+            end
+            portfolio = n
             i += 2
         else
             input_file = args[i]
@@ -47,14 +100,18 @@ function parse_args(args::Vector{String})
         end
     end
 
-    return solver_name, input_file
+    if solver_given && portfolio > 0
+        error("--solver and --portfolio cannot be combined; the portfolio races: $(join(PORTFOLIO, ", "))")
+    end
+
+    return solver_name, input_file, portfolio
 end
 
 function main(args::Vector{String})
-    solver_name, input_file = parse_args(args)
+    solver_name, input_file, portfolio = parse_args(args)
 
     if isnothing(input_file)
-        println("Usage: julia main.jl [--solver <name>] <cnf file>")
+        println("Usage: julia main.jl [--solver <name> | --portfolio <N>] <cnf file>")
         println("Available solvers: $(join(sort(collect(keys(SOLVERS))), ", "))")
         return
     end
@@ -66,13 +123,19 @@ function main(args::Vector{String})
     end
 
     solve_fn = SOLVERS[solver_name]
+    if portfolio > 0
+        solve_fn = inst -> run_portfolio(inst, portfolio)
+    end
     filename = basename(input_file)
     
     try
         instance = parse_cnf_file(input_file)
-        if !isnothing(instance)
-            print(instance)
+        if isnothing(instance)
+            # Same record runAll.sh writes for a failed run
+            println(JSON.json(Dict("Instance" => filename, "Time" => "--", "Result" => "--")))
+            return
         end
+        print(instance)
 
         timer = Timer()
         start!(timer)
@@ -150,8 +150,8 @@ function Solver(instance::SATInstance)
         0, 0, 0, 0
     )
 
-    for clause in instance.clauses
-        add_clause!(solver, copy(clause))
+    for clause_set in instance.clauses
+        add_clause!(solver, collect(clause_set))
     end
     solver.num_original_clauses = length(solver.clauses)
 
@@ -469,9 +469,9 @@ end
 # Entry point (VSIDS + Luby restarts)
 # ──────────────────────────────────────────────────────────────────────────────
 
-function cdcl_solve(instance::SATInstance)::Union{Dict{Int, Bool}, Nothing}
-    if instance === nothing; return nothing; end
-
+# `stop` is polled once per search step so a portfolio run can end the losers.
+function cdcl_solve(instance::SATInstance;
+                    stop::Threads.Atomic{Bool}=Threads.Atomic{Bool}(false))::Union{Dict{Int, Bool}, Nothing}
     for clause in instance.clauses
         if isempty(clause); return nothing; end
     end
@@ -497,6 +497,10 @@ function cdcl_solve(instance::SATInstance)::Union{Dict{Int, Bool}, Nothing}
     next_reduce = reduce_interval
 
     while true
+        # Racing solvers share one heap; let a pending GC proceed
+        GC.safepoint()
+        if stop[]; return nothing; end
+
         conflict = propagate!(solver)
 
         if conflict != 0
@@ -385,9 +385,9 @@ end
 # Entry point (no restarts)
 # ──────────────────────────────────────────────────────────────────────────────
 
-function cdcl_solve(instance::SATInstance)::Union{Dict{Int, Bool}, Nothing}
-    if instance === nothing; return nothing; end
-
+# `stop` is polled once per search step so a portfolio run can end the losers.
+function cdcl_solve(instance::SATInstance;
+                    stop::Threads.Atomic{Bool}=Threads.Atomic{Bool}(false))::Union{Dict{Int, Bool}, Nothing}
     for clause in instance.clauses
         if isempty(clause); return nothing; end
     end
@@ -407,6 +407,10 @@ function cdcl_solve(instance::SATInstance)::Union{Dict{Int, Bool}, Nothing}
     if propagate!(solver) != 0; return nothing; end
 
     while true
+        # Racing solvers share one heap; let a pending GC proceed
+        GC.safepoint()
+        if stop[]; return nothing; end
+
         conflict = propagate!(solver)
 
         if conflict != 0
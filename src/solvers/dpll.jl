@@ -2,327 +2,390 @@ module DPLLSolver
 
 import ..SATInstance
 
-# Optimized DPLL with 2-Watched Literals
-mutable struct WatchedClause
-    literals::Vector{Int}
-    watch1::Int  # index into literals array
-    watch2::Int  # index into literals array
-    
-    function WatchedClause(literals::Vector{Int})
-        n = length(literals)
-        if n == 0
-            error("Empty clause - UNSAT")
-        elseif n == 1
-            new(literals, 1, 1)
-        else
-            new(literals, 1, 2)
-        end
-    end
-end
+@inline lit_index(lit::Int)::Int = lit > 0 ? 2 * lit : 2 * (-lit) - 1
 
+# Optimized DPLL with 2-Watched Literals
+#
+# Clauses live in one flat Int32 buffer: clause c occupies
+# clause_lits[clause_start[c]:clause_start[c + 1] - 1], and its watched
+# literals are kept in the first two slots by swapping. Empty clauses are
+# rejected by run_dpll before a DPLL is built.
 mutable struct DPLL
-    clauses::Vector{WatchedClause}
-    watch_list::Dict{Int, Vector{Int}}
+    clause_lits::Vector{Int32}
+    clause_start::Vector{Int}  # num_clauses + 1 offsets into clause_lits
+    watch_list::Vector{Vector{Int}}  # clause indices watching each literal, by lit_index
     assignment::Vector{Int8}  # 0=unassigned, 1=true, -1=false (indexed by variable)
-    assignment_stack::Vector{Tuple{Int, Bool}}  # (var, value) for backtracking
+    trail::Vector{Int}  # assigned literals in order, undone back to a mark on backtrack
+    qhead::Int  # trail entries up to qhead have been propagated
+    decisions::Vector{Tuple{Int, Bool, Int}}  # (branch literal, other polarity tried, trail mark)
     num_vars::Int
-    decision_level::Int
+    num_active_vars::Int  # variables occurring in some clause
+    active::BitVector  # active[v]: v occurs in some clause, so it may be branched on
+    pure_lits::Vector{Int}  # literals whose negation occurs in no clause
+    
+    # Branching scores indexed by lit_index: Jeroslow-Wang weights at start,
+    # bumped for literals of conflicting clauses (VSIDS-style)
+    scores::Vector{Float64}
+    score_inc::Float64
+    score_decay::Float64
     
     function DPLL(instance::SATInstance)
         num_vars = instance.numVars
-        clauses = WatchedClause[]
-        watch_list = Dict{Int, Vector{Int}}()
+        # Size the flat buffers once so ingestion never regrows them
+        clause_lits = Int32[]
+        sizehint!(clause_lits, sum(length, instance.clauses; init=0))
+        clause_start = Int[1]
+        sizehint!(clause_start, length(instance.clauses) + 1)
+        watch_list = [Int[] for _ in 1:(2 * num_vars)]
+        scores = zeros(Float64, 2 * num_vars)
+        pos_seen = fill(false, num_vars)
+        neg_seen = fill(false, num_vars)
         
         for clause_set in instance.clauses
-            clause_vec = collect(clause_set)
-            if isempty(clause_vec)
-                error("Empty clause found - UNSAT")
+            weight = 2.0^(-length(clause_set))
+            for lit in clause_set
+                push!(clause_lits, Int32(lit))
+                scores[lit_index(lit)] += weight
+                if lit > 0
+                    pos_seen[lit] = true
+                else
+                    neg_seen[-lit] = true
+                end
+            end
+            push!(clause_start, length(clause_lits) + 1)
+        end
+        
+        pure_lits = Int[]
+        active = pos_seen .| neg_seen
+        num_active_vars = count(active)
+        for var in 1:num_vars
+            if pos_seen[var] != neg_seen[var]
+                push!(pure_lits, pos_seen[var] ? var : -var)
             end
-            push!(clauses, WatchedClause(clause_vec))
         end
         
         # Initialize watch lists
-        for (idx, clause) in enumerate(clauses)
-            lit1 = clause.literals[clause.watch1]
-            lit2 = clause.literals[clause.watch2]
+        for idx in 1:(length(clause_start) - 1)
+            first = clause_start[idx]
+            last = clause_start[idx + 1] - 1
             
-            if !haskey(watch_list, lit1)
-                watch_list[lit1] = Int[]
-            end
-            push!(watch_list[lit1], idx)
+            lit1 = Int(clause_lits[first])
+            push!(watch_list[lit_index(lit1)], idx)
             
-            if lit1 != lit2
-                if !haskey(watch_list, lit2)
-                    watch_list[lit2] = Int[]
-                end
-                push!(watch_list[lit2], idx)
+            if last > first
+                lit2 = Int(clause_lits[first + 1])
+                push!(watch_list[lit_index(lit2)], idx)
             end
         end
         
         assignment = zeros(Int8, num_vars + 1)  # 1-indexed
-        assignment_stack = Tuple{Int, Bool}[]
+        trail = Int[]
+        decisions = Tuple{Int, Bool, Int}[]
         
-        new(clauses, watch_list, assignment, assignment_stack, num_vars, 0)
+        new(clause_lits, clause_start, watch_list, assignment, trail, 0, decisions, num_vars,
+            num_active_vars, active, pure_lits, scores, 1.0, 0.95)
     end
 end
 
-@inline function is_satisfied(solver::DPLL, lit::Int)::Bool
-    var = abs(lit)
-    val = solver.assignment[var]
-    if val == 0
-        return false
-    end
-    return (lit > 0 && val == 1) || (lit < 0 && val == -1)
-end
+@inline num_clauses(solver::DPLL)::Int = length(solver.clause_start) - 1
 
-@inline function is_falsified(solver::DPLL, lit::Int)::Bool
-    var = abs(lit)
-    val = solver.assignment[var]
-    if val == 0
-        return false
-    end
-    return (lit > 0 && val == -1) || (lit < 0 && val == 1)
+@inline function clause_literals(solver::DPLL, idx::Int)
+    return @view solver.clause_lits[solver.clause_start[idx]:(solver.clause_start[idx + 1] - 1)]
 end
 
-@inline function is_unassigned(solver::DPLL, lit::Int)::Bool
-    return solver.assignment[abs(lit)] == 0
+# Value of `lit` under the current assignment: 1=true, -1=false, 0=unassigned
+@inline function lit_value(solver::DPLL, lit::Integer)::Int8
+    @inbounds val = solver.assignment[abs(lit)]
+    return lit > 0 ? val : -val
 end
 
-function assign!(solver::DPLL, var::Int, value::Bool)
-    solver.assignment[var] = value ? Int8(1) : Int8(-1)
-    push!(solver.assignment_stack, (var, value))
+@inline is_satisfied(solver::DPLL, lit::Integer)::Bool = lit_value(solver, lit) == Int8(1)
+@inline is_falsified(solver::DPLL, lit::Integer)::Bool = lit_value(solver, lit) == Int8(-1)
+
+# Assign `lit` true in place and record it on the trail. Returns the trail
+# length before the assignment, so callers can undo back to it later.
+function assign!(solver::DPLL, lit::Int)::Int
+    mark = length(solver.trail)
+    solver.assignment[abs(lit)] = lit > 0 ? Int8(1) : Int8(-1)
+    push!(solver.trail, lit)
+    return mark
 end
 
-function backtrack!(solver::DPLL, level::Int)
-    while length(solver.assignment_stack) > level
-        var, _ = pop!(solver.assignment_stack)
-        solver.assignment[var] = 0
+# Pop the trail back to `mark`, unassigning every literal recorded after it.
+function undo_to!(solver::DPLL, mark::Int)
+    while length(solver.trail) > mark
+        lit = pop!(solver.trail)
+        solver.assignment[abs(lit)] = Int8(0)
     end
+    solver.qhead = min(solver.qhead, mark)
 end
 
-function propagate!(solver::DPLL, lit::Int)::Bool
-    neg_lit = -lit
-    
-    if !haskey(solver.watch_list, neg_lit)
-        return true
-    end
-    
-    watching_clauses = solver.watch_list[neg_lit]
-    i = 1
+# Propagate every trail literal not yet processed. Implied literals are
+# appended to the trail and picked up by the same loop. Returns the index of
+# a falsified clause, or 0 if propagation finished without conflict.
+function propagate!(solver::DPLL)::Int
+    # Bind the solver fields once; the loop below only mutates their contents
+    clause_lits = solver.clause_lits
+    clause_start = solver.clause_start
+    watch_list = solver.watch_list
+    trail = solver.trail
+    qhead = solver.qhead
     
-    while i <= length(watching_clauses)
-        clause_idx = watching_clauses[i]
-        clause = solver.clauses[clause_idx]
+    while qhead < length(trail)
+        qhead += 1
+        @inbounds neg_lit = -trail[qhead]
         
-        lit1 = clause.literals[clause.watch1]
-        lit2 = clause.literals[clause.watch2]
-        
-        if lit1 != neg_lit
-            lit1, lit2 = lit2, lit1
-            clause.watch1, clause.watch2 = clause.watch2, clause.watch1
-        end
-        
-        if is_satisfied(solver, lit2)
-            i += 1
+        # Nothing watches the negation of a pure literal; skip the scan
+        @inbounds ws = watch_list[lit_index(neg_lit)]
+        n_ws = length(ws)
+        if n_ws == 0
             continue
         end
         
-        found_new_watch = false
-        for j in 1:length(clause.literals)
-            if j == clause.watch1 || j == clause.watch2
-                continue
-            end
+        # Watchers that stay are compacted into ws[1:j-1] in place
+        i = 1; j = 1
+        
+        while i <= n_ws
+            @inbounds clause_idx = ws[i]
+            @inbounds first = clause_start[clause_idx]
+            @inbounds last = clause_start[clause_idx + 1] - 1
             
-            lit_j = clause.literals[j]
-            if !is_falsified(solver, lit_j)
-                clause.watch1 = j
-                deleteat!(watching_clauses, i)
-                if !haskey(solver.watch_list, lit_j)
-                    solver.watch_list[lit_j] = Int[]
+            # A unit clause watching its only literal is now falsified
+            conflict = first == last
+            
+            if !conflict
+                # Keep the falsified watch in the second slot
+                @inbounds if clause_lits[first] == neg_lit
+                    clause_lits[first], clause_lits[first + 1] = clause_lits[first + 1], clause_lits[first]
+                end
+                @inbounds lit2 = Int(clause_lits[first])
+                
+                if is_satisfied(solver, lit2)
+                    @inbounds ws[j] = clause_idx; j += 1; i += 1
+                    continue
+                end
+                
+                found_new_watch = false
+                @inbounds for k in (first + 2):last
+                    lit_k = Int(clause_lits[k])
+                    if !is_falsified(solver, lit_k)
+                        clause_lits[first + 1], clause_lits[k] = clause_lits[k], clause_lits[first + 1]
+                        push!(watch_list[lit_index(lit_k)], clause_idx)
+                        found_new_watch = true
+                        break
+                    end
+                end
+                
+                if found_new_watch
+                    i += 1
+                    continue
+                end
+                
+                conflict = is_falsified(solver, lit2)
+                if !conflict
+                    assign!(solver, lit2)
                 end
-                push!(solver.watch_list[lit_j], clause_idx)
-                found_new_watch = true
-                break
             end
-        end
-        
-        if found_new_watch
-            continue
-        end
-        
-        if is_falsified(solver, lit2)
-            return false
-        end
-        
-        if is_unassigned(solver, lit2)
-            var2 = abs(lit2)
-            value2 = lit2 > 0
-            assign!(solver, var2, value2)
             
-            if !propagate!(solver, lit2)
-                return false
+            @inbounds ws[j] = clause_idx; j += 1; i += 1
+            
+            if conflict
+                @inbounds while i <= n_ws; ws[j] = ws[i]; j += 1; i += 1; end
+                resize!(ws, j - 1)
+                solver.qhead = qhead
+                return clause_idx
             end
         end
         
-        i += 1
+        resize!(ws, j - 1)
     end
     
-    return true
+    solver.qhead = qhead
+    return 0
 end
 
-function find_unit_clause(solver::DPLL)::Union{Int, Nothing}
-    for clause in solver.clauses
-        satisfied = false
-        unassigned_lit = 0
-        num_unassigned = 0
-        
-        for lit in clause.literals
-            if is_satisfied(solver, lit)
-                satisfied = true
-                break
-            elseif is_unassigned(solver, lit)
-                unassigned_lit = lit
-                num_unassigned += 1
-            end
-        end
-        
-        if !satisfied && num_unassigned == 1
-            return unassigned_lit
-        end
+# Setting a pure literal true never falsifies a clause, so those found while
+# reading the clauses are fixed before search.
+function assign_pure_literals!(solver::DPLL)
+    for lit in solver.pure_lits
+        assign!(solver, lit)
     end
-    return nothing
 end
 
-function all_satisfied(solver::DPLL)::Bool
-    for clause in solver.clauses
-        clause_sat = false
-        for lit in clause.literals
-            if is_satisfied(solver, lit)
-                clause_sat = true
-                break
-            end
+# Unit clauses are only watched once, so they never become unit through
+# propagation; assign them up front and let BCP derive every later unit.
+function assign_unit_clauses!(solver::DPLL)::Bool
+    for idx in 1:num_clauses(solver)
+        first = solver.clause_start[idx]
+        if solver.clause_start[idx + 1] - first != 1
+            continue
+        end
+        
+        lit = Int(solver.clause_lits[first])
+        if is_satisfied(solver, lit)
+            continue
+        elseif is_falsified(solver, lit)
+            return false
         end
-        if !clause_sat
+        
+        assign!(solver, lit)
+        if propagate!(solver) != 0
             return false
         end
     end
     return true
 end
 
-function pick_branching_variable(solver::DPLL)::Union{Int, Nothing}
+function bump_conflict!(solver::DPLL, conflict::Int)
+    scores = solver.scores
+    for lit in clause_literals(solver, conflict)
+        scores[lit_index(Int(lit))] += solver.score_inc
+    end
+    
+    # Decaying every score is the same as growing the increment
+    solver.score_inc /= solver.score_decay
+    if solver.score_inc > 1e100
+        scores .*= 1e-100
+        solver.score_inc *= 1e-100
+    end
+end
+
+# Pick the unassigned active variable with the highest combined score,
+# branching first on its higher-scoring polarity. Scores are never negative,
+# so an active variable whose score is 0.0 can still be picked.
+function pick_branching_literal(solver::DPLL)::Union{Int, Nothing}
+    scores = solver.scores
+    active = solver.active
     best_var = 0
-    best_score = typemax(Int)
+    best_score = -1.0
     
-    for clause in solver.clauses
-        is_sat = false
-        for lit in clause.literals
-            if is_satisfied(solver, lit)
-                is_sat = true
-                break
-            end
-        end
-        if is_sat
+    for var in 1:solver.num_vars
+        if !active[var] || solver.assignment[var] != 0
             continue
         end
-        
-        unassigned = Int[]
-        for lit in clause.literals
-            if is_unassigned(solver, lit)
-                push!(unassigned, abs(lit))
-            end
-        end
-        
-        if !isempty(unassigned) && length(unassigned) < best_score
-            best_score = length(unassigned)
-            best_var = unassigned[1]
+        score = scores[2 * var] + scores[2 * var - 1]
+        if score > best_score
+            best_score = score
+            best_var = var
         end
     end
     
     if best_var == 0
-        for var in 1:solver.num_vars
-            if solver.assignment[var] == 0
-                return var
-            end
-        end
         return nothing
     end
-    
-    return best_var
+    return scores[2 * best_var] >= scores[2 * best_var - 1] ? best_var : -best_var
 end
 
-function solve!(solver::DPLL)::Bool
-    while true
-        unit_lit = find_unit_clause(solver)
-        if isnothing(unit_lit)
-            break
-        end
-        
-        var = abs(unit_lit)
-        value = unit_lit > 0
-        assign!(solver, var, value)
-        
-        if !propagate!(solver, unit_lit)
-            return false
+# Undo the most recent decision whose other polarity is untried and assign
+# that polarity instead. Returns false once every decision is exhausted.
+function backtrack!(solver::DPLL)::Bool
+    while !isempty(solver.decisions)
+        lit, flipped, mark = pop!(solver.decisions)
+        undo_to!(solver, mark)
+        if !flipped
+            assign!(solver, -lit)
+            push!(solver.decisions, (-lit, true, mark))
+            return true
         end
     end
-    
-    if all_satisfied(solver)
-        return true
+    return false
+end
+
+# Drop every decision and return to the root level. Scores are kept, so the
+# next descent starts from the variables involved in recent conflicts.
+function restart!(solver::DPLL)
+    if isempty(solver.decisions)
+        return
     end
-    
-    branch_var = pick_branching_variable(solver)
-    if isnothing(branch_var)
-        return all_satisfied(solver)
+    _, _, mark = solver.decisions[1]
+    undo_to!(solver, mark)
+    empty!(solver.decisions)
+end
+
+function luby(y::Float64, x::Int)::Float64
+    sz = 1; seq = 0
+    while sz < x + 1
+        seq += 1; sz = 2 * sz + 1
     end
-    
-    decision_point = length(solver.assignment_stack)
-    assign!(solver, branch_var, true)
-    
-    if propagate!(solver, branch_var)
-        if solve!(solver)
-            return true
-        end
+    while sz - 1 != x
+        sz = div(sz - 1, 2); seq -= 1
+        if x >= sz; x -= sz; end
     end
+    return y^seq
+end
+
+# Returns false both for UNSAT and when `stop` is raised; run_dpll's caller
+# only sets `stop` once it no longer needs the answer.
+function solve!(solver::DPLL, stop::Threads.Atomic{Bool})::Bool
+    restart_base = 100
+    restart_count = 1
+    conflicts_until_restart = restart_base
     
-    backtrack!(solver, decision_point)
-    assign!(solver, branch_var, false)
-    
-    if propagate!(solver, -branch_var)
-        if solve!(solver)
-            return true
+    while true
+        # Racing solvers share one heap; let a pending GC proceed
+        GC.safepoint()
+        if stop[]
+            return false
+        end
+        
+        conflict = propagate!(solver)
+        if conflict == 0
+            # Propagation without conflict leaves no falsified clause, so once
+            # every occurring variable is assigned all clauses are satisfied.
+            # Only active variables reach the trail, so its length counts them.
+            if length(solver.trail) == solver.num_active_vars
+                return true
+            end
+            
+            branch_lit = pick_branching_literal(solver)
+            if isnothing(branch_lit)
+                return true
+            end
+            
+            mark = assign!(solver, branch_lit)
+            push!(solver.decisions, (branch_lit, false, mark))
+            continue
+        else
+            bump_conflict!(solver, conflict)
+            
+            # Luby restarts; the growing intervals keep the search complete
+            conflicts_until_restart -= 1
+            if conflicts_until_restart <= 0 && !isempty(solver.decisions)
+                restart_count += 1
+                conflicts_until_restart = round(Int, luby(2.0, restart_count) * restart_base)
+                restart!(solver)
+                continue
+            end
+        end
+        
+        if !backtrack!(solver)
+            return false
         end
     end
-    
-    backtrack!(solver, decision_point)
-    return false
 end
 
 function get_solution(solver::DPLL)::Dict{Int, Bool}
     solution = Dict{Int, Bool}()
+    sizehint!(solution, solver.num_vars)
     for var in 1:solver.num_vars
-        if solver.assignment[var] != 0
-            solution[var] = solver.assignment[var] == 1
-        else
-            solution[var] = true
-        end
+        # Unassigned variables are free; report them as true
+        solution[var] = solver.assignment[var] != Int8(-1)
     end
     return solution
 end
 
-function run_dpll(instance::SATInstance)::Union{Dict{Int, Bool}, Nothing}
-    try
-        solver = DPLL(instance)
-        if solve!(solver)
-            return get_solution(solver)
-        else
-            return nothing
-        end
-    catch e
-        if occursin("Empty clause", string(e))
-            return nothing
-        end
-        rethrow(e)
+function run_dpll(instance::SATInstance;
+                  stop::Threads.Atomic{Bool}=Threads.Atomic{Bool}(false))::Union{Dict{Int, Bool}, Nothing}
+    for clause in instance.clauses
+        if isempty(clause); return nothing; end
     end
+    
+    solver = DPLL(instance)
+    assign_pure_literals!(solver)
+    if assign_unit_clauses!(solver) && solve!(solver, stop)
+        return get_solution(solver)
+    end
+    return nothing
 end
 
 end # module DPLLSolver